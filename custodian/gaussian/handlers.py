@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import datetime
-import glob
 import logging
 import math
+import mmap
 import os
 import re
 import shutil
@@ -19,7 +19,11 @@ from custodian.custodian import ErrorHandler
 from custodian.utils import backup
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
 
 __author__ = "Rasha Atwi"
 __version__ = "0.1"
@@ -40,6 +44,32 @@ BACKUP_FILES = {
 }
 
 
+def _find_files(directory: str, *extensions: str) -> dict[str, str]:
+    """
+    Find files with the given extensions in a single pass over a directory.
+
+    Args:
+        directory (str): The directory to search.
+        *extensions (str): The lowercase file extensions to look for, e.g. '.chk'.
+            Matching is case-insensitive and, as with glob, hidden files are ignored.
+
+    Returns:
+        dict:
+            The path of the first file found for each extension. Extensions without a
+            matching file are omitted.
+    """
+    found: dict[str, str] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            ext = os.path.splitext(name)[1]
+            if ext in extensions and ext not in found and not name.startswith("."):
+                found[ext] = entry.path
+                if len(found) == len(extensions):
+                    break
+    return found
+
+
 class GaussianErrorHandler(ErrorHandler):
     """
     Master GaussianErrorHandler class that handles a number of common errors that occur
@@ -67,7 +97,10 @@ class GaussianErrorHandler(ErrorHandler):
         "Out-of-memory error in routine": "insufficient_mem",
     }
 
-    error_patt = re.compile("|".join(list(error_defs)))
+    # each error pattern is wrapped in its own named group so that the error key can
+    # be looked up from `match.lastgroup` without re-matching every pattern
+    error_keys = {f"e{i}": key for i, key in enumerate(error_defs.values())}
+    error_patt = re.compile("|".join(f"(?P<e{i}>{patt})" for i, patt in enumerate(error_defs)))
     recom_mem_patt = re.compile(
         r"Use %mem=([0-9]+)MW to provide the minimum " r"amount of memory required to complete this " r"step."
     )
@@ -77,6 +110,43 @@ class GaussianErrorHandler(ErrorHandler):
         "max_disp": re.compile(r"\s+(Maximum Displacement)\s+(-?\d+.?\d*|.*)\s+(-?\d+.?\d*)"),
         "rms_disp": re.compile(r"\s+(RMS {5}Displacement)\s+(-?\d+.?\d*|.*)\s+(-?\d+.?\d*)"),
     }
+    # union of all convergence criteria, one named group per criterion; the label,
+    # value and threshold follow as the next three groups of the matched criterion
+    conv_patt = re.compile("|".join(f"(?P<{key}>{patt.pattern})" for key, patt in conv_critera.items()))
+    # literal text that each error pattern requires in any line it matches; lines
+    # containing none of these are skipped before running any regex
+    error_prefilters = {
+        "Optimization stopped": "Optimization stopped",
+        "Convergence failure": "Convergence failure",
+        "FormBX had a problem": "FormBX had a problem",
+        "Linear angle in Tors.": "Linear angle in Tors",
+        "Inv3 failed in PCMMkU": "Inv3 failed in PCMMkU",
+        "Error in internal coordinate system": "Error in internal coordinate system",
+        "End of file in ZSymb": "End of file in ZSymb",
+        "There are no atoms in this input structure !": "There are no atoms in this input structure !",
+        "Atom specifications unexpectedly found in input stream.": "Atom specifications unexpectedly found",
+        "End of file reading connectivity.": "End of file reading connectivity",
+        "FileIO operation on non-existent file.": "FileIO operation on non-existent file",
+        "No data on chk file.": "No data on chk file",
+        "Bad file opened by FileIO": "Bad file opened by FileIO",
+        "Z-matrix optimization but no Z-matrix variables.": "Z-matrix optimization but no Z-matrix variables",
+        "A syntax error was detected in the input line.": "A syntax error was detected in the input line",
+        r"The combination of multiplicity ([0-9]+) and \s+? ([0-9]+) electrons is impossible.": (
+            "The combination of multiplicity"
+        ),
+        "Out-of-memory error in routine": "Out-of-memory error in routine",
+    }
+    # every error pattern needs a non-empty literal taken verbatim from the pattern,
+    # otherwise the prefilter would silently drop the lines it matches
+    assert error_prefilters.keys() == error_defs.keys(), "every error pattern needs a prefilter literal"
+    assert all(
+        lit and lit in patt and not re.search(r"[\\.\[\](){}*+?|^$]", lit) for patt, lit in error_prefilters.items()
+    ), "prefilter literals must be non-empty literal text of their pattern"
+    # the convergence literals are only needed when convergence is tracked
+    error_literals = (*dict.fromkeys(error_prefilters.values()), "Use %mem=")
+    fast_literals = (*error_literals, "Force", "Displacement")
+    # number of bytes decompressed per read when scanning compressed output files
+    read_chunk_size = 1 << 20
 
     grid_patt = re.compile(r"(-?\d{5})")
     GRID_NAMES = [
@@ -108,6 +178,7 @@ class GaussianErrorHandler(ErrorHandler):
         lower_basis_set: str | None = None,
         prefix: str = "error",
         check_convergence: bool = True,
+        plot_frequency: int = 1,
     ):
         """
         Initialize the GaussianErrorHandler class.
@@ -135,6 +206,9 @@ class GaussianErrorHandler(ErrorHandler):
                 optimization job. Defaults to True. If True, the convergence data will
                 be monitored and plotted (convergence criteria versus cycle number) and
                 saved to a file called 'convergence.png'.
+            plot_frequency (int): Update the convergence plot on every
+                `plot_frequency`-th check in which convergence data is found. Defaults
+                to 1, i.e. the plot is updated on every check.
         """
         self.input_file = input_file
         self.output_file = output_file
@@ -150,11 +224,50 @@ class GaussianErrorHandler(ErrorHandler):
         self.lower_basis_set = lower_basis_set
         self.prefix = prefix
         self.check_convergence = check_convergence
+        if plot_frequency < 1:
+            raise ValueError(f"plot_frequency must be a positive integer, got {plot_frequency}.")
+        self.plot_frequency = plot_frequency
         self.conv_data: dict[str, dict[str, Any]] = {}
         self.recom_mem: float | None = None
+        # parsed output file, keyed by (path, mtime, size) of the file
+        self._gout_cache: tuple[tuple[str, int, int] | None, GaussianOutput | None] = (None, None)
+        # convergence figure and the (axes, data line, threshold line) of each
+        # criterion, reused between plots
+        self._conv_fig: Figure | None = None
+        self._conv_lines: dict[str, tuple[Axes, Line2D, Line2D]] = {}
+        self._num_conv_checks = 0
+        # float buffers holding the convergence values of each criterion and the
+        # number of values stored in them; grown by doubling their capacity
+        self._conv_buffers: dict[str, np.ndarray] = {}
+        self._conv_counts: dict[str, int] = {}
         self.logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         logging.basicConfig(level=logging.INFO)
 
+    def invalidate(self) -> None:
+        """
+        Discard the cached parsed output file, forcing it to be parsed again on the
+        next call to `check`.
+
+        The cache is keyed on the path, modification time and size of the file, so
+        this is only needed if the file is modified out-of-band in a way that leaves
+        both its modification time and size unchanged.
+        """
+        self._gout_cache = (None, None)
+
+    @staticmethod
+    def _file_key(filename: str) -> tuple[str, int, int]:
+        """
+        Get the key identifying the current state of a file in the parsing cache.
+
+        Args:
+            filename (str): The path to the file.
+
+        Returns:
+            tuple: The path, modification time (in ns) and size of the file.
+        """
+        stat = os.stat(filename)
+        return filename, stat.st_mtime_ns, stat.st_size
+
     @staticmethod
     def _recursive_lowercase(obj: dict[str, Any] | str | Iterable[Any]) -> dict[str, Any] | str | Iterable[Any]:
         """
@@ -165,7 +278,8 @@ class GaussianErrorHandler(ErrorHandler):
         recursively to the values. If the object is a string, it directly converts it
         to lowercase. If the object is iterable (but not a string or dictionary), it
         applies the same lowercase conversion to each element in the iterable. For all
-        other types, the object is returned unchanged.
+        other types, the object is returned unchanged. Nested objects are traversed
+        with an explicit stack instead of recursive calls.
 
         Args:
             obj (dict | str | iterable): The object to be converted to lowercase.
@@ -179,13 +293,34 @@ class GaussianErrorHandler(ErrorHandler):
                 lowercase. The type of the returned object matches the type of the
                 input `obj`.
         """
-        if isinstance(obj, dict):
-            return {k.lower(): GaussianErrorHandler._recursive_lowercase(v) for k, v in obj.items()}
-        if isinstance(obj, str):
-            return obj.lower()
-        if hasattr(obj, "__iter__"):
-            return [GaussianErrorHandler._recursive_lowercase(i) for i in obj]
-        return obj
+        root = [obj]
+        # (container, key) pairs whose value still has to be converted; converted
+        # containers are new objects, so the input is never modified in place
+        stack: list[tuple[Any, Any]] = [(root, 0)]
+        while stack:
+            parent, key = stack.pop()
+            item = parent[key]
+            if isinstance(item, str):
+                parent[key] = item.lower()
+            elif isinstance(item, dict):
+                new_dict: dict[str, Any] = {}
+                for k, v in item.items():
+                    k = k.lower()
+                    if isinstance(v, str):
+                        v = v.lower()
+                    elif v is not None and hasattr(v, "__iter__"):
+                        stack.append((new_dict, k))
+                    new_dict[k] = v
+                parent[key] = new_dict
+            elif hasattr(item, "__iter__"):
+                new_list = list(item)
+                for idx, v in enumerate(new_list):
+                    if isinstance(v, str):
+                        new_list[idx] = v.lower()
+                    elif v is not None and hasattr(v, "__iter__"):
+                        stack.append((new_list, idx))
+                parent[key] = new_list
+        return root[0]
 
     @staticmethod
     def _recursive_remove_space(obj: dict[str, Any]) -> dict[str, Any]:
@@ -435,11 +570,11 @@ class GaussianErrorHandler(ErrorHandler):
         """
         return "16" not in gout.version
 
-    @staticmethod
-    def _monitor_convergence(data: dict[str, dict[str, Any]], directory: str = "./") -> None:
+    def _monitor_convergence(self, data: dict[str, dict[str, Any]], directory: str = "./") -> None:
         """
         Plot and save a convergence graph for an optimization job as a function of the
-        number of iterations.
+        number of iterations. The figure is created on the first call and kept on the
+        handler; subsequent calls only update the plotted data before saving it.
 
         Parameters:
         data (dict): A dictionary containing two keys: 'values' and 'thresh'. 'values'
@@ -450,24 +585,132 @@ class GaussianErrorHandler(ErrorHandler):
         directory (str, optional): The directory where the convergence plot image will
             be saved. Defaults to "./".
         """
-        import matplotlib.pyplot as plt
+        # a standalone Figure renders with the Agg canvas without going through pyplot,
+        # so no GUI backend is probed and the figure is not kept alive by pyplot's
+        # figure manager
+        from matplotlib.figure import Figure
         from matplotlib.ticker import MaxNLocator
 
-        fig, ax = plt.subplots(ncols=2, nrows=2, figsize=(12, 10))
-        for i, (k, v) in enumerate(data["values"].items()):
-            row = int(np.floor(i / 2))
-            col = i % 2
-            iters = range(len(v))
-            ax[row, col].plot(iters, v, color="#cf3759", linewidth=2)
-            ax[row, col].axhline(y=data["thresh"][k], linewidth=2, color="black", linestyle="--")
-            ax[row, col].tick_params(which="major", length=8)
-            ax[row, col].tick_params(axis="both", which="both", direction="in", labelsize=16)
-            ax[row, col].set_xlabel("Iteration", fontsize=16)
-            ax[row, col].set_ylabel(f"{k}", fontsize=16)
-            ax[row, col].xaxis.set_major_locator(MaxNLocator(integer=True))
-            ax[row, col].grid(ls="--", zorder=1)
-        plt.tight_layout()
-        plt.savefig(os.path.join(directory, "convergence.png"))
+        fig = self._conv_fig
+        new_fig = fig is None or list(self._conv_lines) != list(data["values"])
+        if new_fig:
+            fig = self._conv_fig = Figure(figsize=(12, 10))
+            self._conv_lines = {}
+            for i, k in enumerate(data["values"]):
+                ax = fig.add_subplot(2, 2, i + 1)
+                (line,) = ax.plot([], [], color="#cf3759", linewidth=2)
+                thresh_line = ax.axhline(y=data["thresh"][k], linewidth=2, color="black", linestyle="--")
+                ax.tick_params(which="major", length=8)
+                ax.tick_params(axis="both", which="both", direction="in", labelsize=16)
+                ax.set_xlabel("Iteration", fontsize=16)
+                ax.set_ylabel(f"{k}", fontsize=16)
+                ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+                ax.grid(ls="--", zorder=1)
+                self._conv_lines[k] = (ax, line, thresh_line)
+        # the figure is either reused or has just been created above
+        assert fig is not None
+
+        for k, v in data["values"].items():
+            ax, line, thresh_line = self._conv_lines[k]
+            line.set_data(range(len(v)), v)
+            thresh_line.set_ydata([data["thresh"][k]] * 2)
+            ax.relim()
+            ax.autoscale_view()
+        if new_fig:
+            fig.tight_layout()
+        fig.savefig(os.path.join(directory, "convergence.png"))
+
+    def _append_conv_value(self, key: str, value: str) -> None:
+        """
+        Append a convergence value to the buffer of its criterion, doubling the
+        capacity of the buffer when it is full.
+
+        Args:
+            key (str): The convergence criterion, e.g. 'max_force'.
+            value (str): The value as printed in the output file. Values that overflow
+                the output format (printed as '********') are stored as NaN.
+        """
+        count = self._conv_counts.get(key, 0)
+        buffer = self._conv_buffers.get(key)
+        if buffer is None:
+            buffer = self._conv_buffers[key] = np.empty(16)
+        elif count == len(buffer):
+            buffer = self._conv_buffers[key] = np.resize(buffer, 2 * len(buffer))
+        try:
+            buffer[count] = float(value)
+        except ValueError:
+            buffer[count] = np.nan
+        self._conv_counts[key] = count + 1
+
+    @staticmethod
+    def _literal_lines(buf: bytes | mmap.mmap, literals: tuple[bytes, ...], end: int) -> Iterator[str]:
+        """
+        Yield, in order, the lines of buf[:end] that contain at least one of the
+        given byte literals, decoded to str.
+
+        Args:
+            buf (bytes | mmap.mmap): The buffer to search.
+            literals (tuple): The byte strings to search for.
+            end (int): The end of the region of buf to search.
+
+        Yields:
+            str: The matching lines, including their trailing newline if present.
+
+        Raises:
+            ValueError: If one of the literals is empty.
+        """
+        if not all(literals):
+            raise ValueError("Literals to search for must be non-empty.")
+        line_starts = set()
+        for lit in literals:
+            idx = buf.find(lit, 0, end)
+            while idx != -1:
+                line_starts.add(buf.rfind(b"\n", 0, idx) + 1)
+                line_end = buf.find(b"\n", idx, end)
+                if line_end == -1:
+                    break
+                idx = buf.find(lit, line_end + 1, end)
+        for start in sorted(line_starts):
+            line_end = buf.find(b"\n", start, end)
+            yield buf[start : end if line_end == -1 else line_end + 1].decode(errors="ignore")
+
+    @staticmethod
+    def _candidate_lines(filename: str, literals: tuple[str, ...] | None = None) -> Iterator[str]:
+        """
+        Yield, in file order, the lines of a Gaussian output file that contain at least
+        one of the given literals.
+
+        The literals are searched for directly in the raw bytes, so that only the
+        matching lines are decoded. Uncompressed files are memory-mapped and searched
+        in one go; compressed files are decompressed in fixed-size chunks, with the
+        trailing partial line of each chunk carried over to the next one.
+
+        Args:
+            filename (str): The path to the Gaussian output file.
+            literals (tuple): The literal strings to search for. Defaults to
+                `fast_literals`.
+
+        Yields:
+            str: The lines that may match one of the error or convergence patterns.
+        """
+        lit_bytes = tuple(lit.encode() for lit in literals or GaussianErrorHandler.fast_literals)
+        if os.path.splitext(filename)[1].upper() in (".BZ2", ".GZ", ".Z", ".XZ", ".LZMA"):
+            with zopen(filename, mode="rb") as f:
+                tail = b""
+                while chunk := f.read(GaussianErrorHandler.read_chunk_size):
+                    buf = tail + chunk
+                    cut = buf.rfind(b"\n") + 1
+                    yield from GaussianErrorHandler._literal_lines(buf, lit_bytes, cut)
+                    tail = buf[cut:]
+                if tail:
+                    yield from GaussianErrorHandler._literal_lines(tail, lit_bytes, len(tail))
+            return
+
+        with open(filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from GaussianErrorHandler._literal_lines(mm, lit_bytes, len(mm))
 
     def check(self, directory: str = "./") -> bool:
         """Check for errors in the Gaussian output file."""
@@ -478,48 +721,47 @@ class GaussianErrorHandler(ErrorHandler):
                 os.path.join(directory, self.input_file),
             )
 
+        # the input file is cheap to parse, so unlike the output it is not cached
         self.gin = GaussianInput.from_file(os.path.join(directory, self.input_file))
         self.gin.route_parameters = GaussianErrorHandler._recursive_lowercase(self.gin.route_parameters)
         assert isinstance(self.gin.route_parameters, dict)
         self.gin.route_parameters = GaussianErrorHandler._recursive_remove_space(self.gin.route_parameters)
-        self.gout = GaussianOutput(os.path.join(directory, self.output_file))
+        output_path = os.path.join(directory, self.output_file)
+        output_key = GaussianErrorHandler._file_key(output_path)
+        if self._gout_cache[0] != output_key:
+            self._gout_cache = (output_key, GaussianOutput(output_path))
+        self.gout = self._gout_cache[1]
         self.errors = set()
         error_patts = set()
         # TODO: move this to pymatgen?
         self.conv_data = {"values": {}, "thresh": {}}
-        with zopen(os.path.join(directory, self.output_file)) as f:
-            for line in f:
-                error_match = GaussianErrorHandler.error_patt.search(line)
-                mem_match = GaussianErrorHandler.recom_mem_patt.search(line)
-                if error_match:
-                    patt = error_match.group(0)
-                    error_patts.add(patt)
-                    for pattern, error_key in GaussianErrorHandler.error_defs.items():
-                        if re.match(pattern, patt):
-                            self.errors.add(error_key)
-                            break
-                    # self.errors.add(GaussianErrorHandler.error_defs[patt])
-                if mem_match:
-                    mem = mem_match.group(1)
-                    self.recom_mem = GaussianErrorHandler.convert_mem(float(mem), "mw")
-
-                if self.check_convergence and "opt" in self.gin.route_parameters:
-                    for k, v in GaussianErrorHandler.conv_critera.items():
-                        m = v.search(line)
-                        if m:
-                            if k not in self.conv_data["values"]:
-                                self.conv_data["values"][k] = [m.group(2)]
-                                self.conv_data["thresh"][k] = float(m.group(3))
-                            else:
-                                self.conv_data["values"][k].append(m.group(2))
+        self._conv_counts = {}
+        track_conv = self.check_convergence and "opt" in self.gin.route_parameters
+        literals = GaussianErrorHandler.fast_literals if track_conv else GaussianErrorHandler.error_literals
+        for line in GaussianErrorHandler._candidate_lines(output_path, literals):
+            # every alternative of error_patt and conv_patt is a named group, so
+            # lastgroup and lastindex are always set on a match
+            if (m := GaussianErrorHandler.error_patt.search(line)) is not None:
+                assert m.lastgroup is not None
+                error_patts.add(m.group(0))
+                self.errors.add(GaussianErrorHandler.error_keys[m.lastgroup])
+            if (m := GaussianErrorHandler.recom_mem_patt.search(line)) is not None:
+                self.recom_mem = GaussianErrorHandler.convert_mem(float(m.group(1)), "mw")
+            if track_conv and (m := GaussianErrorHandler.conv_patt.search(line)) is not None:
+                assert m.lastgroup is not None
+                assert m.lastindex is not None
+                k = m.lastgroup
+                if k not in self.conv_data["thresh"]:
+                    self.conv_data["thresh"][k] = float(m.group(m.lastindex + 3))
+                self._append_conv_value(k, m.group(m.lastindex + 2))
+        # copy out of the buffers, which are reused and overwritten by the next check
+        self.conv_data["values"] = {k: self._conv_buffers[k][:n].copy() for k, n in self._conv_counts.items()}
 
         # TODO: it only plots after the job finishes, modify?
         if self.conv_data["values"] and all(len(v) >= 2 for v in self.conv_data["values"].values()):
-            for k, v in self.conv_data["values"].items():
-                # convert strings to float taking into account the
-                # possibility of having ******** values
-                self.conv_data["values"][k] = np.genfromtxt(np.array(v))
-            GaussianErrorHandler._monitor_convergence(self.conv_data)
+            self._num_conv_checks += 1
+            if (self._num_conv_checks - 1) % self.plot_frequency == 0:
+                self._monitor_convergence(self.conv_data)
         for patt in error_patts:
             self.logger.error(patt)
         return len(self.errors) > 0
@@ -541,18 +783,21 @@ class GaussianErrorHandler(ErrorHandler):
         # os.remove(f'{self.input_file}.backup')
         backup_files = [self.input_file, self.output_file, self.stderr_file, *BACKUP_FILES.values()]
         backup(backup_files, prefix=self.prefix, directory=directory)
+        route_params = self.gin.route_parameters
         if "scf_convergence" in self.errors:
-            self.gin.route_parameters = GaussianErrorHandler._update_route_params(self.gin.route_parameters, "scf", {})
+            # make sure scf options are stored as a dict, e.g. when only 'scf' or
+            # 'scf=tight' is given
+            scf = GaussianErrorHandler._update_route_params(route_params, "scf", {})["scf"]
             # if the SCF procedure has failed to converge
-            if self.gin.route_parameters.get("scf", {}).get("maxcycle") != str(self.scf_max_cycles):
+            if scf.get("maxcycle") != str(self.scf_max_cycles):
                 # increase number of cycles if not already set or is different
                 # from scf_max_cycles
-                self.gin.route_parameters["scf"]["maxcycle"] = self.scf_max_cycles
+                scf["maxcycle"] = self.scf_max_cycles
                 actions.append({"scf_max_cycles": self.scf_max_cycles})
 
-            elif not {"xqc", "yqc", "qc"}.intersection(self.gin.route_parameters.get("scf", set())):
+            elif not {"xqc", "yqc", "qc"}.intersection(scf):
                 # use an alternate SCF converger
-                self.gin.route_parameters["scf"]["xqc"] = None
+                scf["xqc"] = None
                 actions.append({"scf_algorithm": "xqc"})
 
             elif self.job_type == "better_guess" and not GaussianErrorHandler.activate_better_guess:
@@ -581,8 +826,15 @@ class GaussianErrorHandler(ErrorHandler):
 
         elif "opt_steps" in self.errors:
             # int_actions = self._add_int()
-            if self.gin.route_parameters.get("opt").get("maxcycles") != str(self.opt_max_cycles):
-                self.gin.route_parameters["opt"]["maxcycles"] = self.opt_max_cycles
+            # make sure opt options are stored as a dict, e.g. when only 'opt' or
+            # 'opt=tight' is given
+            opt = (
+                GaussianErrorHandler._update_route_params(route_params, "opt", {})["opt"]
+                if "opt" in route_params
+                else None
+            )
+            if opt is not None and opt.get("maxcycles") != str(self.opt_max_cycles):
+                opt["maxcycles"] = self.opt_max_cycles
                 if len(self.gout.structures) > 1:
                     self.gin._mol = self.gout.final_structure
                     actions.append({"structure": "from_final_structure"})
@@ -707,7 +959,7 @@ class GaussianErrorHandler(ErrorHandler):
                 return {"errors": [self.errors], "actions": None}
 
         elif "coords" in self.errors:
-            if "connectivity" in self.gin.route_parameters.get("geom"):
+            if "connectivity" in (self.gin.route_parameters.get("geom") or {}):
                 self.logger.info("Explicit atom bonding is requested but no " "such input is provided")
                 if isinstance(self.gin.route_parameters["geom"], dict) and len(self.gin.route_parameters["geom"]) > 1:
                     self.gin.route_parameters["geom"].pop("connectivity", None)
@@ -755,7 +1007,7 @@ class GaussianErrorHandler(ErrorHandler):
         elif "missing_mol" in self.errors:
             if (
                 not self.gin.molecule
-                and "read" in self.gin.route_parameters.get("guess")
+                and "read" in (self.gin.route_parameters.get("guess") or {})
                 and not any(
                     key in self.gin.route_parameters.get("geom", {}) for key in ["checkpoint", "check", "allcheck"]
                 )
@@ -763,7 +1015,7 @@ class GaussianErrorHandler(ErrorHandler):
                 # if molecule is not specified and the user requests that the
                 # initial guess be read from the checkpoint file but forgot to
                 # take the geom from the checkpoint file, add geom=check
-                if not glob.glob("*.[Cc][Hh][Kk]"):
+                if not _find_files(directory, ".chk"):
                     raise FileNotFoundError(
                         "This remedy reads geometry from " "checkpoint file. This file is " "missing!"
                     )
@@ -881,8 +1133,8 @@ class WallTimeErrorHandler(ErrorHandler):
         # TODO: when using restart, the rwf file might be in a different dir
         backup_files = [self.input_file, self.output_file, self.stderr_file, *BACKUP_FILES.values()]
         backup(backup_files, prefix=self.prefix, directory=directory)
-        if glob.glob(os.path.join(directory, BACKUP_FILES["rwf"])):
-            rwf = glob.glob(os.path.join(directory, BACKUP_FILES["rwf"]))[0]
+        rwf = _find_files(directory, ".rwf").get(".rwf")
+        if rwf:
             gin = GaussianInput.from_file(os.path.join(directory, self.input_file))
             # TODO: check if rwf is already there like RWF or Rwf or ...
             # gin.link0_parameters.update({'%rwf': rwf})
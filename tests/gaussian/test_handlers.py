@@ -2,10 +2,15 @@ import datetime
 import glob
 import gzip
 import os
+import re
 import shutil
 from unittest import TestCase
+from unittest.mock import patch
 
-from custodian.gaussian.handlers import GaussianErrorHandler, WallTimeErrorHandler
+import numpy as np
+import pytest
+
+from custodian.gaussian.handlers import GaussianErrorHandler, WallTimeErrorHandler, _find_files
 from tests.conftest import TEST_FILES
 
 __author__ = "Rasha Atwi"
@@ -50,6 +55,24 @@ class TestGaussianErrorHandler(TestCase):
             {"opt_max_cycles": 100},
         ]
 
+    def test_opt_steps_string_opt(self):
+        gunzip_file(f"{TEST_DIR}/opt_steps_cycles.out.gz")
+        shutil.copyfile(f"{TEST_DIR}/opt_steps_cycles.out", f"{SCR_DIR}/opt_steps_cycles.out")
+        with open(f"{TEST_DIR}/opt_steps_cycles.com") as file:
+            gin = file.read().replace("Opt=(MaxCycles=1)", "Opt=Tight")
+        with open(f"{SCR_DIR}/opt_steps_cycles.com", "w") as file:
+            file.write(gin)
+        handler = GaussianErrorHandler(
+            input_file="opt_steps_cycles.com",
+            output_file="opt_steps_cycles.out",
+            opt_max_cycles=100,
+        )
+        handler.check()
+        dct = handler.correct()
+        assert dct["errors"] == ["opt_steps"]
+        assert {"opt_max_cycles": 100} in dct["actions"]
+        assert handler.gin.route_parameters["opt"] == {"tight": None, "maxcycles": 100}
+
     def test_opt_steps_from_structure(self):
         gunzip_file(f"{TEST_DIR}/opt_steps_from_structure.out.gz")
         for file in ["opt_steps_from_structure.com", "opt_steps_from_structure.out"]:
@@ -307,6 +330,142 @@ class TestGaussianErrorHandler(TestCase):
         assert dct["errors"] == ["insufficient_mem"]
         assert dct["actions"] == [{"memory": "increase_to_gaussian_recommendation"}]
 
+    def test_fast_literals(self):
+        lines = [
+            " Optimization stopped.",
+            " The combination of multiplicity 1 and    17 electrons is impossible.",
+            " Use %mem=123MW to provide the minimum amount of memory required to complete this step.",
+            "         Maximum Force            0.000014     0.000450     YES",
+            "         RMS     Displacement     0.000594     0.001200     YES",
+        ]
+        for line in lines:
+            assert any(lit in line for lit in GaussianErrorHandler.fast_literals)
+        assert not any(lit in " SCF Done:  E(RB3LYP) =  -76.4089" for lit in GaussianErrorHandler.fast_literals)
+
+    def test_error_prefilters(self):
+        lines = [
+            " Optimization stopped.",
+            " Convergence failure -- run terminated.",
+            " FormBX had a problem.",
+            " Linear angle in Torsions.",
+            " Inv3 failed in PCMMkU.",
+            " Error in internal coordinate system.",
+            " End of file in ZSymb.",
+            " There are no atoms in this input structure !",
+            " Atom specifications unexpectedly found in input stream.",
+            " End of file reading connectivity.",
+            " FileIO operation on non-existent file.",
+            " No data on chk file.",
+            " Bad file opened by FileIO",
+            " Z-matrix optimization but no Z-matrix variables.",
+            " A syntax error was detected in the input line.",
+            " The combination of multiplicity 1 and    17 electrons is impossible.",
+            " Out-of-memory error in routine UNKNOWN-IO_OPEN (IEnd=   123 MxCore=   456)",
+        ]
+        for patt in GaussianErrorHandler.error_defs:
+            matched = [line for line in lines if re.search(patt, line)]
+            assert matched, patt
+            for line in matched:
+                assert any(lit in line for lit in GaussianErrorHandler.error_literals), line
+
+    def test_parse_cache(self):
+        gunzip_file(f"{TEST_DIR}/opt_steps_cycles.out.gz")
+        for file in ["opt_steps_cycles.com", "opt_steps_cycles.out"]:
+            shutil.copyfile(f"{TEST_DIR}/{file}", f"{SCR_DIR}/{file}")
+        handler = GaussianErrorHandler(
+            input_file="opt_steps_cycles.com",
+            output_file="opt_steps_cycles.out",
+        )
+        handler.check()
+        gout = handler.gout
+        handler.gin.route_parameters["opt"]["maxcycles"] = 5
+        handler.check()
+        assert handler.gout is gout
+        assert handler.gin.route_parameters["opt"].get("maxcycles") != 5
+
+        with open("opt_steps_cycles.out", "a") as file:
+            file.write("\n")
+        handler.check()
+        assert handler.gout is not gout
+
+        gout = handler.gout
+        handler.invalidate()
+        handler.check()
+        assert handler.gout is not gout
+
+    def test_monitor_convergence(self):
+        gunzip_file(f"{TEST_DIR}/mol_opt.out.gz")
+        for file in ["mol_opt.com", "mol_opt.out"]:
+            shutil.copyfile(f"{TEST_DIR}/{file}", f"{SCR_DIR}/{file}")
+        handler = GaussianErrorHandler(
+            input_file="mol_opt.com",
+            output_file="mol_opt.out",
+            plot_frequency=2,
+        )
+        handler.check()
+        assert os.path.exists("convergence.png")
+        fig = handler._conv_fig
+        x_data, y_data = handler._conv_lines["max_force"][1].get_data()
+        assert list(x_data) == list(range(5))
+        assert list(y_data) == list(handler.conv_data["values"]["max_force"])
+        assert not np.shares_memory(handler.conv_data["values"]["max_force"], handler._conv_buffers["max_force"])
+
+        os.remove("convergence.png")
+        handler.check()
+        assert not os.path.exists("convergence.png")
+        handler.check()
+        assert os.path.exists("convergence.png")
+        assert handler._conv_fig is fig
+
+        with pytest.raises(ValueError, match="plot_frequency must be a positive integer"):
+            GaussianErrorHandler(input_file="mol_opt.com", output_file="mol_opt.out", plot_frequency=0)
+
+    def test_append_conv_value(self):
+        handler = GaussianErrorHandler(input_file="mol_opt.com", output_file="mol_opt.out")
+        for i in range(40):
+            handler._append_conv_value("max_force", str(i))
+        handler._append_conv_value("max_force", "********")
+        assert handler._conv_counts["max_force"] == 41
+        values = handler._conv_buffers["max_force"][:41]
+        assert list(values[:40]) == list(range(40))
+        assert np.isnan(values[40])
+
+    def test_find_files(self):
+        for file in ["Optimization.FCHK", "Optimization.chk", ".hidden.rwf"]:
+            open(file, "w").close()
+        assert _find_files(".", ".chk", ".fchk") == {".chk": "./Optimization.chk", ".fchk": "./Optimization.FCHK"}
+        assert _find_files(".", ".rwf") == {}
+
+    def test_recursive_lowercase(self):
+        route_params = {"Opt": {"MaxCycles": "100", "CalcFC": None}, "SCF": ("XQC", ["Tight"]), "N": 3}
+        assert GaussianErrorHandler._recursive_lowercase(route_params) == {
+            "opt": {"maxcycles": "100", "calcfc": None},
+            "scf": ["xqc", ["tight"]],
+            "n": 3,
+        }
+        assert route_params["Opt"] == {"MaxCycles": "100", "CalcFC": None}
+        assert GaussianErrorHandler._recursive_lowercase("B3LYP") == "b3lyp"
+        assert GaussianErrorHandler._recursive_lowercase(None) is None
+
+    def test_candidate_lines(self):
+        output_file = gunzip_file(f"{TEST_DIR}/opt_steps_cycles.out.gz")
+        lines = list(GaussianErrorHandler._candidate_lines(output_file))
+        assert lines == list(GaussianErrorHandler._candidate_lines(f"{TEST_DIR}/opt_steps_cycles.out.gz"))
+        assert any("Optimization stopped" in line for line in lines)
+        assert any("Maximum Force" in line for line in lines)
+        error_lines = list(GaussianErrorHandler._candidate_lines(output_file, GaussianErrorHandler.error_literals))
+        assert any("Optimization stopped" in line for line in error_lines)
+        assert not any("Maximum Force" in line for line in error_lines)
+        # lines must survive being split across decompressed chunks
+        with patch.object(GaussianErrorHandler, "read_chunk_size", 64):
+            assert lines == list(GaussianErrorHandler._candidate_lines(f"{TEST_DIR}/opt_steps_cycles.out.gz"))
+
+    def test_literal_lines(self):
+        buf = b"a x\nb\nx c\n"
+        assert list(GaussianErrorHandler._literal_lines(buf, (b"x",), len(buf))) == ["a x\n", "x c\n"]
+        with pytest.raises(ValueError, match="must be non-empty"):
+            list(GaussianErrorHandler._literal_lines(buf, (b"",), len(buf)))
+
     def tearDown(self):
         os.chdir(CWD)
         shutil.rmtree(SCR_DIR)